@@ -1,10 +1,12 @@
 import collections
 import copy
+import functools
 import os
 import pathlib
 import re
-import textwrap
+import threading
 import warnings
+import weakref
 from enum import Enum
 from importlib import metadata as importlib_metadata
 from typing import Any, DefaultDict, Dict, List, Optional, Tuple
@@ -29,7 +31,12 @@ class CONDA_OS(Enum):
 
 
 _NODEFAULTS = "nodefaults"
-_SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE: Dict[str, List[version.Version]] = {}
+# Packages available differ between Snowflake deployments, thus versions are cached per session, each entry guarded by
+# its own lock. The module lock only guards creating the per-session entry.
+_SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE: (
+    "weakref.WeakKeyDictionary[session.Session, Tuple[threading.Lock, Dict[str, List[version.Version]]]]"
+) = weakref.WeakKeyDictionary()
+_SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE_LOCK = threading.Lock()
 _SNOWFLAKE_CONDA_PACKAGE_CACHE: Dict[str, List[version.Version]] = {}
 _SUPPORTED_PACKAGE_SPEC_OPS = ["==", ">=", "<=", ">", "<"]
 
@@ -41,8 +48,32 @@ SNOWFLAKE_CONDA_CHANNEL_URL = os.getenv(
 )
 
 
-def _validate_pip_requirement_string(req_str: str) -> requirements.Requirement:
-    """Validate the input pip requirement string according to PEP 508.
+def _copy_requirement(
+    req: requirements.Requirement, specifier: Optional[specifiers.SpecifierSet] = None
+) -> requirements.Requirement:
+    """Make a copy of a requirement without re-parsing or deep-copying it. The copy shares the immutable parts of the
+    original requirement, thus the specifier of the copy should be replaced rather than modified in place.
+
+    Args:
+        req: The requirement to copy.
+        specifier: The specifier set of the copy. If not provided, the specifier of the original requirement is used.
+
+    Returns:
+        A new requirements.Requirement object.
+    """
+    new_req = requirements.Requirement.__new__(requirements.Requirement)
+    new_req.name = req.name
+    new_req.url = req.url
+    new_req.extras = set(req.extras)
+    new_req.specifier = req.specifier if specifier is None else specifier
+    new_req.marker = req.marker
+    return new_req
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_pip_requirement_string(req_str: str) -> requirements.Requirement:
+    """Parse and validate the input pip requirement string according to PEP 508. Results are cached and shared, thus
+    they should never be modified in place. Use _validate_pip_requirement_string to get a copy.
 
     Args:
         req_str: The string contains the pip requirement specification.
@@ -50,10 +81,9 @@ def _validate_pip_requirement_string(req_str: str) -> requirements.Requirement:
     Raises:
         ValueError: Raised when python is specified as a dependency.
         ValueError: Raised when invalid requirement string confronted.
-        ValueError: Raised when requirement containing marker record confronted.
 
     Returns:
-        A requirements.Requirement object containing the requirement information.
+        A shared requirements.Requirement object containing the requirement information.
     """
     try:
         r = requirements.Requirement(req_str)
@@ -66,9 +96,23 @@ def _validate_pip_requirement_string(req_str: str) -> requirements.Requirement:
     return r
 
 
-def _validate_conda_dependency_string(dep_str: str) -> Tuple[str, requirements.Requirement]:
-    """Validate conda dependency string like `pytorch == 1.12.1` or `conda-forge::transformer` and split the channel
-        name before the double colon and requirement specification after that.
+def _validate_pip_requirement_string(req_str: str) -> requirements.Requirement:
+    """Validate the input pip requirement string according to PEP 508.
+
+    Args:
+        req_str: The string contains the pip requirement specification.
+
+    Returns:
+        A requirements.Requirement object containing the requirement information.
+    """
+    return _copy_requirement(_parse_pip_requirement_string(req_str))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_conda_dependency_string(dep_str: str) -> Tuple[str, requirements.Requirement]:
+    """Parse and validate conda dependency string like `pytorch == 1.12.1` or `conda-forge::transformer` and split the
+        channel name before the double colon and requirement specification after that. Results are cached and shared,
+        thus they should never be modified in place. Use _validate_conda_dependency_string to get a copy.
 
     Args:
         dep_str: The string contains the conda dependency specification.
@@ -79,10 +123,11 @@ def _validate_conda_dependency_string(dep_str: str) -> Tuple[str, requirements.R
         ValueError: Raised when conda dependency operator ~= which is not supported by conda.
 
     Returns:
-        A tuple containing the conda channel name and requirement.Requirement object showing requirement information.
+        A tuple containing the conda channel name and shared requirement.Requirement object showing requirement
+        information.
     """
     channel_str, _, requirement_str = dep_str.rpartition("::")
-    r = _validate_pip_requirement_string(requirement_str)
+    r = _parse_pip_requirement_string(requirement_str)
     if channel_str != "pip":
         if r.marker:
             raise ValueError("Markers is not supported in conda dependency.")
@@ -96,6 +141,20 @@ def _validate_conda_dependency_string(dep_str: str) -> Tuple[str, requirements.R
     return (channel_str, r)
 
 
+def _validate_conda_dependency_string(dep_str: str) -> Tuple[str, requirements.Requirement]:
+    """Validate conda dependency string like `pytorch == 1.12.1` or `conda-forge::transformer` and split the channel
+        name before the double colon and requirement specification after that.
+
+    Args:
+        dep_str: The string contains the conda dependency specification.
+
+    Returns:
+        A tuple containing the conda channel name and requirement.Requirement object showing requirement information.
+    """
+    channel_str, r = _parse_conda_dependency_string(dep_str)
+    return (channel_str, _copy_requirement(r))
+
+
 def _check_if_requirement_same(req_a: requirements.Requirement, req_b: requirements.Requirement) -> bool:
     """Check if two requirements are the same package.
 
@@ -117,26 +176,57 @@ class DuplicateDependencyInMultipleChannelsError(Exception):
     ...
 
 
-def append_requirement_list(req_list: List[requirements.Requirement], p_req: requirements.Requirement) -> None:
+def _build_requirement_name_index(req_list: List[requirements.Requirement]) -> Dict[str, requirements.Requirement]:
+    # Iterate in reverse so that the first requirement of a name wins, as a scan over the list would find it.
+    return {req.name: req for req in reversed(req_list)}
+
+
+def append_requirement_list(
+    req_list: List[requirements.Requirement],
+    p_req: requirements.Requirement,
+    name_to_requirement: Optional[Dict[str, requirements.Requirement]] = None,
+) -> None:
     """Append a requirement to an existing requirement list. If need and able to merge, merge it, otherwise, append it.
 
     Args:
         req_list: The target requirement list.
         p_req: The requirement to append.
+        name_to_requirement: An optional index mapping the package name to the requirement of every requirement already
+            in req_list. If provided, it is used to look up duplicates and updated with the appended requirement; it
+            must include every requirement in req_list, and entries no longer in req_list cause it to be rebuilt. If
+            not provided, it is built from req_list.
 
     Raises:
         DuplicateDependencyError: Raised when the same package being added.
     """
-    for req in req_list:
-        if _check_if_requirement_same(p_req, req):
-            raise DuplicateDependencyError(
-                f"Found duplicate dependencies in pip requirements: {str(req)} and {str(p_req)}."
-            )
+    if name_to_requirement is None:
+        name_to_requirement = _build_requirement_name_index(req_list)
+    req = name_to_requirement.get(p_req.name)
+    if req is not None and not any(req is list_req for list_req in req_list):
+        # The index is out of sync with req_list, rebuild it in place.
+        name_to_requirement.clear()
+        name_to_requirement.update(_build_requirement_name_index(req_list))
+        req = name_to_requirement.get(p_req.name)
+    if req is not None:
+        raise DuplicateDependencyError(
+            f"Found duplicate dependencies in pip requirements: {str(req)} and {str(p_req)}."
+        )
     req_list.append(p_req)
+    name_to_requirement[p_req.name] = p_req
+
+
+def _build_conda_name_to_channel(conda_chan_deps: DefaultDict[str, List[requirements.Requirement]]) -> Dict[str, str]:
+    return {
+        chan_req.name: chan_channel
+        for chan_channel, chan_req_list in conda_chan_deps.items()
+        for chan_req in chan_req_list
+    }
 
 
 def append_conda_dependency(
-    conda_chan_deps: DefaultDict[str, List[requirements.Requirement]], p_chan_dep: Tuple[str, requirements.Requirement]
+    conda_chan_deps: DefaultDict[str, List[requirements.Requirement]],
+    p_chan_dep: Tuple[str, requirements.Requirement],
+    name_to_channel: Optional[Dict[str, str]] = None,
 ) -> None:
     """Append a conda dependency to an existing conda dependencies dict, if not existed in any channel.
         To avoid making unnecessary modification to dict, we check the existence first, then try to merge, then append,
@@ -145,25 +235,40 @@ def append_conda_dependency(
     Args:
         conda_chan_deps: The target dependencies dict.
         p_chan_dep: The tuple of channel and dependency to append.
+        name_to_channel: An optional index mapping the package name to the channel of every dependency already in
+            conda_chan_deps. If provided, it is used to look up duplicates and updated with the appended dependency;
+            it must include every dependency in conda_chan_deps, and entries no longer in conda_chan_deps cause it to
+            be rebuilt. If not provided, it is built from conda_chan_deps.
 
     Raises:
         DuplicateDependencyError: Raised when the same package required from one channel.
         DuplicateDependencyInMultipleChannelsError: Raised when the same package required from different channels.
     """
     p_channel, p_req = p_chan_dep
-    for chan_channel, chan_req_list in conda_chan_deps.items():
-        for chan_req in chan_req_list:
-            if _check_if_requirement_same(p_req, chan_req):
-                if chan_channel != p_channel:
-                    raise DuplicateDependencyInMultipleChannelsError(
-                        "Found duplicate dependencies: "
-                        + f"{str(chan_req)} in channel {chan_channel} and {str(p_req)} in channel {p_channel}."
-                    )
-                else:
-                    raise DuplicateDependencyError(
-                        f"Found duplicate dependencies in channel {chan_channel}: {str(chan_req)} and {str(p_req)}."
-                    )
+    if name_to_channel is None:
+        name_to_channel = _build_conda_name_to_channel(conda_chan_deps)
+    chan_channel = name_to_channel.get(p_req.name)
+    # Use get() so that a stale index entry does not add an empty channel to the defaultdict.
+    if chan_channel is not None and not any(
+        _check_if_requirement_same(p_req, req) for req in conda_chan_deps.get(chan_channel, [])
+    ):
+        # The index is out of sync with conda_chan_deps, rebuild it in place.
+        name_to_channel.clear()
+        name_to_channel.update(_build_conda_name_to_channel(conda_chan_deps))
+        chan_channel = name_to_channel.get(p_req.name)
+    if chan_channel is not None:
+        chan_req = next(req for req in conda_chan_deps[chan_channel] if _check_if_requirement_same(p_req, req))
+        if chan_channel != p_channel:
+            raise DuplicateDependencyInMultipleChannelsError(
+                "Found duplicate dependencies: "
+                + f"{str(chan_req)} in channel {chan_channel} and {str(p_req)} in channel {p_channel}."
+            )
+        else:
+            raise DuplicateDependencyError(
+                f"Found duplicate dependencies in channel {chan_channel}: {str(chan_req)} and {str(p_req)}."
+            )
     conda_chan_deps[p_channel].append(p_req)
+    name_to_channel[p_req.name] = p_channel
 
 
 def validate_pip_requirement_string_list(req_str_list: List[str]) -> List[requirements.Requirement]:
@@ -176,8 +281,11 @@ def validate_pip_requirement_string_list(req_str_list: List[str]) -> List[requir
         A requirements.Requirement list containing the requirement information.
     """
     seen_pip_requirement_list: List[requirements.Requirement] = []
+    name_to_requirement: Dict[str, requirements.Requirement] = {}
     for req_str in req_str_list:
-        append_requirement_list(seen_pip_requirement_list, _validate_pip_requirement_string(req_str=req_str))
+        append_requirement_list(
+            seen_pip_requirement_list, _validate_pip_requirement_string(req_str=req_str), name_to_requirement
+        )
 
     return seen_pip_requirement_list
 
@@ -194,16 +302,35 @@ def validate_conda_dependency_string_list(dep_str_list: List[str]) -> DefaultDic
     """
     validated_conda_dependency_list = list(map(_validate_conda_dependency_string, dep_str_list))
     ret_conda_dependency_dict: DefaultDict[str, List[requirements.Requirement]] = collections.defaultdict(list)
+    # Index by package name so that duplicate detection does not need to scan every channel for each dependency.
+    name_to_channel: Dict[str, str] = {}
     for p_channel, p_req in validated_conda_dependency_list:
-        append_conda_dependency(ret_conda_dependency_dict, (p_channel, p_req))
+        append_conda_dependency(ret_conda_dependency_dict, (p_channel, p_req), name_to_channel)
 
     return ret_conda_dependency_dict
 
 
+@functools.lru_cache(maxsize=None)
+def _get_local_installed_version(pkg_name: str) -> Optional[str]:
+    """Get the version string of a locally installed distribution. Results are cached since the installed packages
+    are not expected to change during the lifetime of the process.
+
+    Args:
+        pkg_name: The name of the distribution.
+
+    Returns:
+        The installed version string, or None if the distribution is not found.
+    """
+    try:
+        return importlib_metadata.distribution(pkg_name).version
+    except importlib_metadata.PackageNotFoundError:
+        return None
+
+
 def get_local_installed_version_of_pip_package(pip_req: requirements.Requirement) -> requirements.Requirement:
     """Get the local installed version of a given pip package requirement.
         If the package is locally installed, and the local version meet the specifier of the requirements, return a new
-        requirement specifier that pins the version.
+        requirement specifier that pins the version, or the original package requirement if it already pins it.
         If the local version does not meet the specifier of the requirements, a warn will be omitted and returns
         the original package requirement.
         If the package is not locally installed or not found, the original package requirement is returned.
@@ -214,16 +341,12 @@ def get_local_installed_version_of_pip_package(pip_req: requirements.Requirement
     Returns:
         A requirements.Requirement object that might have version pinned to local installed version.
     """
-    try:
-        local_dist = importlib_metadata.distribution(pip_req.name)
-        local_dist_version = local_dist.version
-    except importlib_metadata.PackageNotFoundError:
+    local_dist_version = _get_local_installed_version(pip_req.name)
+    if local_dist_version is None:
         if pip_req.name == SNOWPARK_ML_PKG_NAME:
             local_dist_version = snowml_env.VERSION
         else:
             return pip_req
-    new_pip_req = copy.deepcopy(pip_req)
-    new_pip_req.specifier = specifiers.SpecifierSet(specifiers=f"=={version.parse(local_dist_version).base_version}")
     if not pip_req.specifier.contains(local_dist_version):
         warnings.warn(
             f"Package requirement {str(pip_req)} specified, while version {local_dist_version} is installed. "
@@ -232,7 +355,11 @@ def get_local_installed_version_of_pip_package(pip_req: requirements.Requirement
             category=UserWarning,
         )
         return pip_req
-    return new_pip_req
+    pinned_specifier_str = f"=={version.parse(local_dist_version).base_version}"
+    if str(pip_req.specifier) == pinned_specifier_str:
+        # Already pinned to the local version, no need to make a new requirement.
+        return pip_req
+    return _copy_requirement(pip_req, specifier=specifiers.SpecifierSet(specifiers=pinned_specifier_str))
 
 
 class IncorrectLocalEnvironmentError(Exception):
@@ -310,11 +437,12 @@ def get_package_spec_with_supported_ops_only(req: requirements.Requirement) -> r
     Returns:
         A requirements.Requirement object with supported ops only
     """
-    new_req = copy.deepcopy(req)
-    new_req.specifier = specifiers.SpecifierSet(
-        specifiers=",".join([str(spec) for spec in req.specifier if spec.operator in _SUPPORTED_PACKAGE_SPEC_OPS])
+    return _copy_requirement(
+        req,
+        specifier=specifiers.SpecifierSet(
+            specifiers=",".join([str(spec) for spec in req.specifier if spec.operator in _SUPPORTED_PACKAGE_SPEC_OPS])
+        ),
     )
-    return new_req
 
 
 def relax_requirement_version(req: requirements.Requirement) -> requirements.Requirement:
@@ -327,9 +455,8 @@ def relax_requirement_version(req: requirements.Requirement) -> requirements.Req
     Returns:
         A new requirement object after relaxations.
     """
-    new_req = copy.deepcopy(req)
     relaxed_specifier_set = set()
-    for spec in new_req.specifier._specs:
+    for spec in req.specifier._specs:
         if spec.operator != "==":
             relaxed_specifier_set.add(spec)
             continue
@@ -343,8 +470,23 @@ def relax_requirement_version(req: requirements.Requirement) -> requirements.Req
         assert pinned_version is not None
         relaxed_specifier_set.add(specifiers.Specifier(f">={pinned_version.major}.{pinned_version.minor}"))
         relaxed_specifier_set.add(specifiers.Specifier(f"<{pinned_version.major + 1}"))
-    new_req.specifier._specs = frozenset(relaxed_specifier_set)
-    return new_req
+    relaxed_specifier = specifiers.SpecifierSet()
+    relaxed_specifier._specs = frozenset(relaxed_specifier_set)
+    return _copy_requirement(req, specifier=relaxed_specifier)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_version(version_str: str) -> version.Version:
+    """Parse a version string. Results are cached as the same versions show up repeatedly when listing the packages
+    available in Snowflake.
+
+    Args:
+        version_str: The version string.
+
+    Returns:
+        A version.Version object.
+    """
+    return version.parse(version_str)
 
 
 def get_matched_package_versions_in_snowflake_conda_channel(
@@ -383,16 +525,18 @@ def get_matched_package_versions_in_snowflake_conda_channel(
             assert isinstance(repodata, dict)
             packages_info = repodata["packages"]
             assert isinstance(packages_info, dict)
-            version_list = [
-                version.parse(package_info["version"])
-                for package_info in packages_info.values()
-                if package_info["name"] == req.name and python_version_build_str in package_info["build"]
-            ]
+            version_list = sorted(
+                {
+                    _parse_version(package_info["version"])
+                    for package_info in packages_info.values()
+                    if package_info["name"] == req.name and python_version_build_str in package_info["build"]
+                }
+            )
             _SNOWFLAKE_CONDA_PACKAGE_CACHE[req.name] = version_list
         except Exception:
             pass
 
-    matched_versions = list(req.specifier.filter(set(_SNOWFLAKE_CONDA_PACKAGE_CACHE.get(req.name, []))))
+    matched_versions = list(req.specifier.filter(_SNOWFLAKE_CONDA_PACKAGE_CACHE.get(req.name, [])))
     return matched_versions
 
 
@@ -423,55 +567,51 @@ def get_matched_package_versions_in_information_schema(
     """
     ret_dict: Dict[str, List[version.Version]] = {}
     reqs_to_request: List[requirements.Requirement] = []
-    for req in reqs:
-        if req.name in _SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE:
-            available_versions = list(
-                sorted(req.specifier.filter(set(_SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.get(req.name, []))))
-            )
-            ret_dict[req.name] = available_versions
-        else:
-            reqs_to_request.append(req)
-
-    if reqs_to_request:
-        pkg_names_str = " OR ".join(
-            f"package_name = '{req_name}'" for req_name in sorted(req.name for req in reqs_to_request)
-        )
+    with _SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE_LOCK:
+        session_lock, package_cache = _SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.setdefault(session, (threading.Lock(), {}))
+    # Hold the session's lock while querying, so that concurrent callers on the same session do not issue the same
+    # query, while lookups on other sessions are not blocked.
+    with session_lock:
+        for req in reqs:
+            if req.name in package_cache:
+                available_versions = list(req.specifier.filter(package_cache.get(req.name, [])))
+                ret_dict[req.name] = available_versions
+            else:
+                reqs_to_request.append(req)
+
+        if reqs_to_request:
+            pkg_names_str = ", ".join(f"'{req_name}'" for req_name in sorted(req.name for req in reqs_to_request))
 
-        parsed_python_version = version.Version(python_version)
-        sql = textwrap.dedent(
-            f"""
-            SELECT PACKAGE_NAME, VERSION
-            FROM information_schema.packages
-            WHERE ({pkg_names_str})
-            AND language = 'python'
-            AND (runtime_version = '{parsed_python_version.major}.{parsed_python_version.minor}'
-                OR runtime_version is null);
-            """
-        )
+            parsed_python_version = version.Version(python_version)
+            sql = (
+                "SELECT PACKAGE_NAME, VERSION FROM information_schema.packages"
+                f" WHERE package_name IN ({pkg_names_str})"
+                " AND language = 'python'"
+                f" AND (runtime_version = '{parsed_python_version.major}.{parsed_python_version.minor}'"
+                " OR runtime_version is null);"
+            )
 
-        try:
-            result = (
-                query_result_checker.SqlResultValidator(
-                    session=session,
-                    query=sql,
+            try:
+                result = (
+                    query_result_checker.SqlResultValidator(
+                        session=session,
+                        query=sql,
+                    )
+                    .has_column("VERSION")
+                    .has_dimensions(expected_rows=None, expected_cols=2)
+                    .validate()
                 )
-                .has_column("VERSION")
-                .has_dimensions(expected_rows=None, expected_cols=2)
-                .validate()
-            )
-            for row in result:
-                req_name = row["PACKAGE_NAME"]
-                req_ver = version.parse(row["VERSION"])
-                cached_req_ver_list = _SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.get(req_name, [])
-                cached_req_ver_list.append(req_ver)
-                _SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE[req_name] = cached_req_ver_list
-        except snowflake.connector.DataError:
-            return ret_dict
-    for req in reqs_to_request:
-        available_versions = list(
-            sorted(req.specifier.filter(set(_SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.get(req.name, []))))
-        )
-        ret_dict[req.name] = available_versions
+                for row in result:
+                    package_cache.setdefault(row["PACKAGE_NAME"], []).append(_parse_version(row["VERSION"]))
+            except snowflake.connector.DataError:
+                return ret_dict
+            # Deduplicate and sort the cached versions once, so that lookups only need to filter them in order.
+            for req in reqs_to_request:
+                if req.name in package_cache:
+                    package_cache[req.name] = sorted(set(package_cache[req.name]))
+        for req in reqs_to_request:
+            available_versions = list(req.specifier.filter(package_cache.get(req.name, [])))
+            ret_dict[req.name] = available_versions
     return ret_dict
 
 
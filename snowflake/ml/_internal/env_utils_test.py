@@ -5,7 +5,7 @@ import platform
 import tempfile
 import textwrap
 from importlib import metadata as importlib_metadata
-from typing import DefaultDict, List, cast
+from typing import DefaultDict, Dict, List, cast
 from unittest import mock
 
 import yaml
@@ -43,6 +43,16 @@ class EnvUtilsTest(absltest.TestCase):
         with self.assertRaises(ValueError):
             env_utils._validate_pip_requirement_string("_python-package==1.0.1")
 
+        r = env_utils._validate_pip_requirement_string("python-package==1.0.1")
+        r.specifier = specifiers.SpecifierSet("==1.0.2")
+        r.name = "another-python-package"
+        self.assertIsNot(r, env_utils._validate_pip_requirement_string("python-package==1.0.1"))
+        self.assertEqual(env_utils._validate_pip_requirement_string("python-package==1.0.1").name, "python-package")
+        self.assertEqual(
+            env_utils._validate_pip_requirement_string("python-package==1.0.1").specifier,
+            specifiers.SpecifierSet("==1.0.1"),
+        )
+
     def test_validate_conda_dependency_string(self) -> None:
         c, r = env_utils._validate_conda_dependency_string("python-package==1.0.1")
         self.assertEqual(c, "")
@@ -138,6 +148,27 @@ class EnvUtilsTest(absltest.TestCase):
         env_utils.append_requirement_list(rl, ra)
         self.assertListEqual(rl, trl)
 
+        rl = []
+        name_to_requirement: Dict[str, requirements.Requirement] = {}
+        ra = requirements.Requirement("python-package==1.0.1")
+        rb = requirements.Requirement("another-python-package")
+        env_utils.append_requirement_list(rl, ra, name_to_requirement)
+        env_utils.append_requirement_list(rl, rb, name_to_requirement)
+        self.assertListEqual(rl, [ra, rb])
+        self.assertDictEqual(name_to_requirement, {"python-package": ra, "another-python-package": rb})
+        with self.assertRaises(env_utils.DuplicateDependencyError):
+            env_utils.append_requirement_list(rl, requirements.Requirement("python-package"), name_to_requirement)
+
+        # A stale index is rebuilt instead of trusted.
+        rl = [ra]
+        name_to_requirement = {"python-package": ra, "removed-python-package": rb}
+        with self.assertRaises(env_utils.DuplicateDependencyError):
+            env_utils.append_requirement_list(rl, requirements.Requirement("python-package"), name_to_requirement)
+        rc = requirements.Requirement("removed-python-package")
+        env_utils.append_requirement_list(rl, rc, name_to_requirement)
+        self.assertListEqual(rl, [ra, rc])
+        self.assertDictEqual(name_to_requirement, {"python-package": ra, "removed-python-package": rc})
+
     def test_append_conda_dependency(self) -> None:
         rd: DefaultDict[str, List[requirements.Requirement]] = collections.defaultdict(list)
         with self.assertRaises(env_utils.DuplicateDependencyError):
@@ -164,6 +195,41 @@ class EnvUtilsTest(absltest.TestCase):
             ra = requirements.Requirement("python-package!=1.0.2")
             env_utils.append_conda_dependency(rd, ("a", ra))
 
+        rd = collections.defaultdict(list)
+        name_to_channel: Dict[str, str] = {}
+        env_utils.append_conda_dependency(rd, ("a", requirements.Requirement("python-package==1.0.1")), name_to_channel)
+        env_utils.append_conda_dependency(
+            rd, ("b", requirements.Requirement("another-python-package")), name_to_channel
+        )
+        self.assertDictEqual(name_to_channel, {"python-package": "a", "another-python-package": "b"})
+        with self.assertRaises(env_utils.DuplicateDependencyError):
+            env_utils.append_conda_dependency(rd, ("a", requirements.Requirement("python-package")), name_to_channel)
+        with self.assertRaises(env_utils.DuplicateDependencyInMultipleChannelsError):
+            env_utils.append_conda_dependency(
+                rd, ("a", requirements.Requirement("another-python-package")), name_to_channel
+            )
+
+        # A stale index is rebuilt instead of trusted.
+        rd = collections.defaultdict(list)
+        rd["a"] = [requirements.Requirement("python-package==1.0.1")]
+        name_to_channel = {"python-package": "b", "removed-python-package": "a"}
+        with self.assertRaises(env_utils.DuplicateDependencyError):
+            env_utils.append_conda_dependency(rd, ("a", requirements.Requirement("python-package")), name_to_channel)
+        self.assertDictEqual(name_to_channel, {"python-package": "a"})
+        self.assertNotIn("b", rd)
+        env_utils.append_conda_dependency(
+            rd, ("a", requirements.Requirement("removed-python-package")), name_to_channel
+        )
+        self.assertDictEqual(
+            rd,
+            {
+                "a": [
+                    requirements.Requirement("python-package==1.0.1"),
+                    requirements.Requirement("removed-python-package"),
+                ]
+            },
+        )
+
     def test_validate_pip_requirement_string_list(self) -> None:
         with self.assertRaises(env_utils.DuplicateDependencyError):
             rl = ["python-package==1.0.1", "python-package!=1.0.2"]
@@ -235,6 +301,12 @@ class EnvUtilsTest(absltest.TestCase):
         )
 
         r = requirements.Requirement(f"pip=={importlib_metadata.version('pip')}")
+        self.assertIs(
+            r,
+            env_utils.get_local_installed_version_of_pip_package(r),
+        )
+
+        r = requirements.Requirement(f"pip>={importlib_metadata.version('pip')}")
         self.assertIsNot(
             r,
             env_utils.get_local_installed_version_of_pip_package(r),
@@ -265,12 +337,22 @@ class EnvUtilsTest(absltest.TestCase):
 
         mock_distribution = mock.MagicMock()
         mock_distribution.version = "1.0.0.post100"
+        env_utils._get_local_installed_version.cache_clear()
         with mock.patch.object(importlib_metadata, "distribution", return_value=mock_distribution):
             r = requirements.Requirement("pip")
             self.assertEqual(
                 requirements.Requirement("pip==1.0.0"),
                 env_utils.get_local_installed_version_of_pip_package(r),
             )
+        env_utils._get_local_installed_version.cache_clear()
+
+        # Test cache
+        with mock.patch.object(importlib_metadata, "distribution") as mock_distribution_fn:
+            mock_distribution_fn.return_value = mock_distribution
+            env_utils.get_local_installed_version_of_pip_package(requirements.Requirement("pip"))
+            env_utils.get_local_installed_version_of_pip_package(requirements.Requirement("pip>=1.0.0"))
+            mock_distribution_fn.assert_called_once_with("pip")
+        env_utils._get_local_installed_version.cache_clear()
 
     def test_get_package_spec_with_supported_ops_only(self) -> None:
         r = requirements.Requirement("python-package==1.0.1")
@@ -348,6 +430,10 @@ class EnvUtilsTest(absltest.TestCase):
         self.assertEqual(env_utils.relax_requirement_version(r), requirements.Requirement("python-package"))
         self.assertIsNot(env_utils.relax_requirement_version(r), r)
 
+        r = requirements.Requirement("python-package[extra]==1.0.1")
+        env_utils.relax_requirement_version(r)
+        self.assertEqual(r, requirements.Requirement("python-package[extra]==1.0.1"))
+
     def test_get_matched_package_versions_in_information_schema(self) -> None:
         m_session = mock_session.MockSession(conn=None, test_case=self)
 
@@ -355,7 +441,7 @@ class EnvUtilsTest(absltest.TestCase):
             f"""
             SELECT PACKAGE_NAME, VERSION
             FROM information_schema.packages
-            WHERE (package_name = 'pytorch' OR package_name = 'xgboost')
+            WHERE package_name IN ('pytorch', 'xgboost')
             AND language = 'python'
             AND (runtime_version = '{platform.python_version_tuple()[0]}.{platform.python_version_tuple()[1]}'
                 OR runtime_version is null);
@@ -396,14 +482,44 @@ class EnvUtilsTest(absltest.TestCase):
             },
         )
 
+        # Test cache is not shared across sessions
+        query = textwrap.dedent(
+            f"""
+            SELECT PACKAGE_NAME, VERSION
+            FROM information_schema.packages
+            WHERE package_name IN ('xgboost')
+            AND language = 'python'
+            AND (runtime_version = '{platform.python_version_tuple()[0]}.{platform.python_version_tuple()[1]}'
+                OR runtime_version is null);
+            """
+        )
+        sql_result = [
+            row.Row(PACKAGE_NAME="xgboost", VERSION="1.7.3"),
+        ]
+
+        another_m_session = mock_session.MockSession(conn=None, test_case=self)
+        another_m_session.add_mock_sql(query=query, result=mock_data_frame.MockDataFrame(sql_result))
+        another_c_session = cast(session.Session, another_m_session)
+
+        self.assertDictEqual(
+            env_utils.get_matched_package_versions_in_information_schema(
+                session=another_c_session,
+                reqs=[requirements.Requirement("xgboost")],
+                python_version=snowml_env.PYTHON_VERSION,
+            ),
+            {
+                "xgboost": list(map(version.parse, ["1.7.3"])),
+            },
+        )
+
         # clear cache
-        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE = {}
+        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.clear()
 
         query = textwrap.dedent(
             f"""
             SELECT PACKAGE_NAME, VERSION
             FROM information_schema.packages
-            WHERE (package_name = 'xgboost')
+            WHERE package_name IN ('xgboost')
             AND language = 'python'
             AND (runtime_version = '{platform.python_version_tuple()[0]}.{platform.python_version_tuple()[1]}'
                 OR runtime_version is null);
@@ -446,7 +562,7 @@ class EnvUtilsTest(absltest.TestCase):
             f"""
             SELECT PACKAGE_NAME, VERSION
             FROM information_schema.packages
-            WHERE (package_name = 'pytorch')
+            WHERE package_name IN ('pytorch')
             AND language = 'python'
             AND (runtime_version = '{platform.python_version_tuple()[0]}.{platform.python_version_tuple()[1]}'
                 OR runtime_version is null);
@@ -456,7 +572,6 @@ class EnvUtilsTest(absltest.TestCase):
             row.Row(PACKAGE_NAME="pytorch", VERSION="1.12.1"),
         ]
 
-        m_session = mock_session.MockSession(conn=None, test_case=self)
         m_session.add_mock_sql(query=query, result=mock_data_frame.MockDataFrame(sql_result))
         c_session = cast(session.Session, m_session)
 
@@ -486,13 +601,13 @@ class EnvUtilsTest(absltest.TestCase):
         )
 
         # clear cache
-        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE = {}
+        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.clear()
 
         query = textwrap.dedent(
             f"""
             SELECT PACKAGE_NAME, VERSION
             FROM information_schema.packages
-            WHERE (package_name = 'xgboost')
+            WHERE package_name IN ('xgboost')
             AND language = 'python'
             AND (runtime_version = '{platform.python_version_tuple()[0]}.{platform.python_version_tuple()[1]}'
                 OR runtime_version is null);
@@ -553,7 +668,7 @@ class EnvUtilsTest(absltest.TestCase):
         )
 
         # clear cache
-        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE = {}
+        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.clear()
 
         m_session.add_mock_sql(query=query, result=mock_data_frame.MockDataFrame(sql_result))
         c_session = cast(session.Session, m_session)
@@ -582,7 +697,7 @@ class EnvUtilsTest(absltest.TestCase):
         )
 
         # clear cache
-        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE = {}
+        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.clear()
 
         m_session.add_mock_sql(query=query, result=mock_data_frame.MockDataFrame(sql_result))
         c_session = cast(session.Session, m_session)
@@ -611,13 +726,13 @@ class EnvUtilsTest(absltest.TestCase):
         )
 
         # clear cache
-        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE = {}
+        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.clear()
 
         query = textwrap.dedent(
             f"""
             SELECT PACKAGE_NAME, VERSION
             FROM information_schema.packages
-            WHERE (package_name = 'python-package')
+            WHERE package_name IN ('python-package')
             AND language = 'python'
             AND (runtime_version = '{platform.python_version_tuple()[0]}.{platform.python_version_tuple()[1]}'
                 OR runtime_version is null);
@@ -638,6 +753,52 @@ class EnvUtilsTest(absltest.TestCase):
             {},
         )
 
+    def test_get_matched_package_versions_in_information_schema_per_session_lock(self) -> None:
+        env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE.clear()
+
+        query = textwrap.dedent(
+            f"""
+            SELECT PACKAGE_NAME, VERSION
+            FROM information_schema.packages
+            WHERE package_name IN ('xgboost')
+            AND language = 'python'
+            AND (runtime_version = '{platform.python_version_tuple()[0]}.{platform.python_version_tuple()[1]}'
+                OR runtime_version is null);
+            """
+        )
+        sql_result = [row.Row(PACKAGE_NAME="xgboost", VERSION="1.7.3")]
+
+        sessions = []
+        for _ in range(2):
+            m_session = mock_session.MockSession(conn=None, test_case=self)
+            m_session.add_mock_sql(query=query, result=mock_data_frame.MockDataFrame(sql_result))
+            sessions.append(cast(session.Session, m_session))
+
+        self.assertDictEqual(
+            env_utils.get_matched_package_versions_in_information_schema(
+                session=sessions[0],
+                reqs=[requirements.Requirement("xgboost")],
+                python_version=snowml_env.PYTHON_VERSION,
+            ),
+            {"xgboost": [version.parse("1.7.3")]},
+        )
+
+        # A lookup holding the first session's lock must not block lookups on another session.
+        session_lock, _ = env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE[sessions[0]]
+        with session_lock:
+            self.assertDictEqual(
+                env_utils.get_matched_package_versions_in_information_schema(
+                    session=sessions[1],
+                    reqs=[requirements.Requirement("xgboost")],
+                    python_version=snowml_env.PYTHON_VERSION,
+                ),
+                {"xgboost": [version.parse("1.7.3")]},
+            )
+        self.assertIsNot(
+            env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE[sessions[1]][0],
+            env_utils._SNOWFLAKE_INFO_SCHEMA_PACKAGE_CACHE[sessions[0]][0],
+        )
+
     def test_parse_python_version_string(self) -> None:
         self.assertIsNone(env_utils.parse_python_version_string("not_python"))
         self.assertEqual(env_utils.parse_python_version_string("python"), "")
@@ -12,9 +12,17 @@ from snowflake.ml.feature_store import Entity, FeatureView  # type: ignore[attr-
 from snowflake.snowpark import DataFrame, Session, functions as F
 from snowflake.snowpark.types import TimestampTimeZone, TimestampType
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_EXAMPLES_ROOT_DIR = Path(__file__).parent
+_SOURCE_DATA_DIR = _EXAMPLES_ROOT_DIR / "source_data"
+
 
 class ExampleHelper:
     def __init__(self, session: Session, database_name: str, dataset_schema: str) -> None:
@@ -43,13 +51,17 @@ class ExampleHelper:
 
     def list_examples(self) -> Optional[DataFrame]:
         """Return a dataframe object about descriptions of all examples."""
-        root_dir = Path(__file__).parent
         rows = []
-        for f_name in os.listdir(root_dir):
-            if os.path.isdir(os.path.join(root_dir, f_name)) and f_name[0].isalpha() and f_name != "source_data":
-                source_file_path = root_dir.joinpath(f"{f_name}/source.yaml")
-                source_dict = self._read_yaml(str(source_file_path))
-                rows.append((f_name, source_dict["model_category"], source_dict["desc"], source_dict["label_columns"]))
+        with os.scandir(_EXAMPLES_ROOT_DIR) as entries:
+            example_names = [
+                entry.name
+                for entry in entries
+                if entry.is_dir() and entry.name[0].isalpha() and entry.name != "source_data"
+            ]
+        for f_name in example_names:
+            source_file_path = _EXAMPLES_ROOT_DIR.joinpath(f"{f_name}/source.yaml")
+            source_dict = self._read_yaml(str(source_file_path))
+            rows.append((f_name, source_dict["model_category"], source_dict["desc"], source_dict["label_columns"]))
         return self._session.create_dataframe(rows, schema=["NAME", "MODEL_CATEGORY", "DESC", "LABEL_COLS"])
 
     def load_draft_feature_views(self) -> List[FeatureView]:
@@ -59,13 +71,13 @@ class ExampleHelper:
             A list of FeatureView object.
         """
         fvs = []
-        root_dir = Path(__file__).parent.joinpath(f"{self._selected_example}/features")
-        for f_name in os.listdir(root_dir):
-            if not f_name[0].isalpha():
-                # skip folders like __pycache__
-                continue
-            mod_path = f"{__package__}.{self._selected_example}.features.{f_name.rstrip('.py')}"
-            mod = importlib.import_module(mod_path)
+        root_dir = _EXAMPLES_ROOT_DIR.joinpath(f"{self._selected_example}/features")
+        with os.scandir(root_dir) as entries:
+            # skip folders like __pycache__
+            feature_file_names = [entry.name for entry in entries if entry.name[0].isalpha()]
+        mod_path_prefix = f"{__package__}.{self._selected_example}.features."
+        for f_name in feature_file_names:
+            mod = importlib.import_module(mod_path_prefix + f_name.removesuffix(".py"))
             fv = mod.create_draft_feature_view(
                 self._session, self._source_dfs, self._source_tables, self._database_name, self._dataset_schema
             )
@@ -85,7 +97,7 @@ class ExampleHelper:
 
     def _read_yaml(self, file_path: str) -> Any:
         with open(file_path) as fs:
-            return yaml.safe_load(fs)
+            return yaml.load(fs, Loader=_YamlLoader)
 
     def _create_file_format(self, format_dict: Dict[str, str], format_name: str) -> None:
         """Create a file name with given name."""
@@ -145,28 +157,30 @@ class ExampleHelper:
         return [schema_dict["destination_table_name"]]
 
     def _load_parquet(self, schema_dict: Dict[str, str], temp_stage_name: str) -> List[str]:
-        regex_pattern = schema_dict["load_files_pattern"]
-        all_files = self._session.sql(f"list @{temp_stage_name}").collect()
-        filtered_files = [item["name"] for item in all_files if re.match(regex_pattern, item["name"])]
+        files_pattern = re.compile(schema_dict["load_files_pattern"])
+        all_files = self._session.sql(f"list @{temp_stage_name}").to_local_iterator()
+        filtered_files = [item["name"] for item in all_files if files_pattern.match(item["name"])]
         file_count = len(filtered_files)
+        table_name_pattern = re.compile(schema_dict["destination_table_name"]) if file_count > 1 else None
         result = []
 
         for file in filtered_files:
             file_name = file.rsplit("/", 1)[-1]
 
             df = self._session.read.parquet(f"@{temp_stage_name}/{file_name}")
-            for old_col_name in df.columns:
-                df = df.with_column_renamed(old_col_name, identifier.get_unescaped_names(old_col_name))
-
-            # convert timestamp column to ntz
-            for name, type in dict(df.dtypes).items():
-                if type == "timestamp":
-                    df = df.with_column(name, F.to_timestamp_ntz(name))
-
-            # convert epoch column to ntz timestamp
-            for ts_col in self._epoch_to_timestamp_cols:
-                if "timestamp" != dict(df.dtypes)[ts_col]:
-                    df = df.with_column(ts_col, F.cast(df[ts_col] / 1000000, TimestampType(TimestampTimeZone.NTZ)))
+            df = df.to_df(identifier.get_unescaped_names(df.columns))
+
+            # convert timestamp column to ntz, and epoch column to ntz timestamp, in a single projection. Converted
+            # columns are placed after the others, timestamp columns first, as replacing them one by one used to do.
+            dtypes = dict(df.dtypes)
+            timestamp_cols = [name for name, type in df.dtypes if type == "timestamp"]
+            epoch_cols = [name for name in dict.fromkeys(self._epoch_to_timestamp_cols) if dtypes[name] != "timestamp"]
+            converted_cols = set(timestamp_cols).union(epoch_cols)
+            df = df.select(
+                [df[name] for name, _ in df.dtypes if name not in converted_cols]
+                + [F.to_timestamp_ntz(name).alias(name) for name in timestamp_cols]
+                + [F.cast(df[name] / 1000000, TimestampType(TimestampTimeZone.NTZ)).alias(name) for name in epoch_cols]
+            )
 
             if self._add_id_column:
                 df = df.withColumn(self._add_id_column, F.monotonically_increasing_id())
@@ -177,8 +191,8 @@ class ExampleHelper:
                 )
                 result.append(schema_dict["destination_table_name"])
             else:
-                regex_pattern = schema_dict["destination_table_name"]
-                dest_table_name = re.match(regex_pattern, file_name).group("table_name")  # type: ignore[union-attr]
+                assert table_name_pattern is not None
+                dest_table_name = table_name_pattern.match(file_name).group("table_name")  # type: ignore[union-attr]
                 result.append(dest_table_name)
                 dest_table_name = f"{self._database_name}.{self._dataset_schema}.{dest_table_name}"
 
@@ -223,8 +237,7 @@ class ExampleHelper:
         self._selected_example = example_name  # type: ignore[assignment]
 
         # load source yaml file
-        root_dir = Path(__file__).parent
-        source_file_path = root_dir.joinpath(f"{self._selected_example}/source.yaml")
+        source_file_path = _EXAMPLES_ROOT_DIR.joinpath(f"{self._selected_example}/source.yaml")
         source_dict = self._read_yaml(str(source_file_path))
         self._source_tables = []
         self._source_dfs = []
@@ -255,8 +268,7 @@ class ExampleHelper:
         Returns:
             Return a list of Snowflake tables.
         """
-        root_dir = Path(__file__).parent
-        schema_file = root_dir.joinpath(f"source_data/{source_data_name}.yaml")
+        schema_file = _SOURCE_DATA_DIR.joinpath(f"{source_data_name}.yaml")
         destination_tables = self._load_source_data(str(schema_file))
         for dest_table in destination_tables:
             source_df = self._session.table(dest_table)
@@ -119,7 +119,12 @@ class ModelEnv:
             pkgs: A list of ModelDependency namedtuple to be appended.
             check_local_version: Flag to indicate if it is required to pin to local version. Defaults to False.
         """
-
+        pip_names = {added_pip_req.name for added_pip_req in self._pip_requirements}
+        name_to_channel = {
+            conda_req.name: channel
+            for channel, conda_req_list in self._conda_dependencies.items()
+            for conda_req in conda_req_list
+        }
         for conda_req_str, pip_name in pkgs:
             conda_req_channel, conda_req = env_utils._validate_conda_dependency_string(conda_req_str)
             if check_local_version:
@@ -130,7 +135,7 @@ class ModelEnv:
                 req_to_add = conda_req
             show_warning_message = conda_req_channel == env_utils.DEFAULT_CHANNEL_NAME
 
-            if any(added_pip_req.name == pip_name for added_pip_req in self._pip_requirements):
+            if pip_name in pip_names:
                 if show_warning_message:
                     warnings.warn(
                         (
@@ -143,7 +148,9 @@ class ModelEnv:
                 continue
 
             try:
-                env_utils.append_conda_dependency(self._conda_dependencies, (conda_req_channel, req_to_add))
+                env_utils.append_conda_dependency(
+                    self._conda_dependencies, (conda_req_channel, req_to_add), name_to_channel=name_to_channel
+                )
             except env_utils.DuplicateDependencyError:
                 pass
             except env_utils.DuplicateDependencyInMultipleChannelsError:
@@ -166,11 +173,14 @@ class ModelEnv:
         """
 
         pip_reqs = env_utils.validate_pip_requirement_string_list(pkgs)
+        name_to_requirement = {added_pip_req.name: added_pip_req for added_pip_req in self._pip_requirements}
         for pip_req in pip_reqs:
             if check_local_version:
                 pip_req = env_utils.get_local_installed_version_of_pip_package(pip_req)
             try:
-                env_utils.append_requirement_list(self._pip_requirements, pip_req)
+                env_utils.append_requirement_list(
+                    self._pip_requirements, pip_req, name_to_requirement=name_to_requirement
+                )
             except env_utils.DuplicateDependencyError:
                 pass
 
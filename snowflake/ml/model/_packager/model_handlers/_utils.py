@@ -138,7 +138,8 @@ def get_target_methods(
     default_target_methods: Iterable[str],
 ) -> Sequence[str]:
     if target_methods is None:
-        target_methods = [method_name for method_name in default_target_methods if _is_callable(model, method_name)]
+        # Defaults are filtered by the same probe validate_target_methods would run, so no need to re-check them.
+        return [method_name for method_name in default_target_methods if _is_callable(model, method_name)]
 
     validate_target_methods(model, target_methods)
     return target_methods
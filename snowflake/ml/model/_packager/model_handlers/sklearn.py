@@ -1,6 +1,17 @@
 import os
+import pickle
 import warnings
-from typing import TYPE_CHECKING, Callable, Dict, Optional, Type, Union, cast, final
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Type,
+    Union,
+    cast,
+    final,
+)
 
 import cloudpickle
 import numpy as np
@@ -35,6 +46,7 @@ class SKLModelHandler(_base.BaseModelHandler[Union["sklearn.base.BaseEstimator",
     HANDLER_TYPE = "sklearn"
     HANDLER_VERSION = "2023-12-01"
     _MIN_SNOWPARK_ML_VERSION = "1.0.12"
+    _MIN_SNOWPARK_ML_VERSION_JOBLIB = "1.7.0"
     _HANDLER_MIGRATOR_PLANS: Dict[str, Type[base_migrator.BaseModelHandlerMigrator]] = {}
 
     DEFAULT_TARGET_METHODS = [
@@ -46,6 +58,9 @@ class SKLModelHandler(_base.BaseModelHandler[Union["sklearn.base.BaseEstimator",
     ]
     EXPLAIN_TARGET_METHODS = ["predict", "predict_proba", "predict_log_proba"]
 
+    _PICKLE_FILE_TYPE = "pickle"
+    _JOBLIB_FILE_TYPE = "joblib"
+
     @classmethod
     def can_handle(
         cls,
@@ -60,10 +75,7 @@ class SKLModelHandler(_base.BaseModelHandler[Union["sklearn.base.BaseEstimator",
             and (
                 not type_utils.LazyType("lightgbm.LGBMModel").isinstance(model)
             )  # LGBMModel is actually a BaseEstimator
-            and any(
-                (hasattr(model, method) and callable(getattr(model, method, None)))
-                for method in cls.DEFAULT_TARGET_METHODS
-            )
+            and any(callable(getattr(model, method, None)) for method in cls.DEFAULT_TARGET_METHODS)
         )
 
     @classmethod
@@ -91,6 +103,9 @@ class SKLModelHandler(_base.BaseModelHandler[Union["sklearn.base.BaseEstimator",
     ) -> None:
         # setting None by default to distinguish if users did not set it
         enable_explainability = kwargs.get("enable_explainability", None)
+        model_file_type = kwargs.pop("model_file_type", cls._PICKLE_FILE_TYPE)
+        if model_file_type not in (cls._PICKLE_FILE_TYPE, cls._JOBLIB_FILE_TYPE):
+            raise ValueError(f"Unsupported model file type {model_file_type} for scikit-learn model.")
 
         import sklearn.base
         import sklearn.pipeline
@@ -108,13 +123,31 @@ class SKLModelHandler(_base.BaseModelHandler[Union["sklearn.base.BaseEstimator",
                 default_target_methods=cls.DEFAULT_TARGET_METHODS,
             )
 
+            # These pipeline methods transform the input through every step but the last and then call the final
+            # step's method of the same name, so for pipelines the shared preprocessing is run only once. Other
+            # methods (e.g. inverse_transform) traverse the steps differently and call the full pipeline.
+            pipeline_final_estimator = (
+                model[-1] if isinstance(model, sklearn.pipeline.Pipeline) and len(model.steps) > 1 else None
+            )
+            pipeline_shortcut_methods = set(cls.DEFAULT_TARGET_METHODS) | {"score_samples"}
+            # validate_signature passes the same sample input to every call, so it is transformed at most once.
+            pipeline_transformed_input: Optional[Any] = None
+
             def get_prediction(
                 target_method_name: str,
                 sample_input_data: model_types.SupportedLocalDataType,
             ) -> model_types.SupportedLocalDataType:
+                nonlocal pipeline_transformed_input
                 if not isinstance(sample_input_data, (pd.DataFrame, np.ndarray)):
                     sample_input_data = model_signature._convert_local_data_to_df(sample_input_data)
 
+                final_estimator_method = getattr(pipeline_final_estimator, target_method_name, None)
+                if target_method_name in pipeline_shortcut_methods and callable(final_estimator_method):
+                    assert isinstance(model, sklearn.pipeline.Pipeline)
+                    if pipeline_transformed_input is None:
+                        pipeline_transformed_input = model[:-1].transform(sample_input_data)
+                    return final_estimator_method(pipeline_transformed_input)
+
                 target_method = getattr(model, target_method_name, None)
                 assert callable(target_method)
                 predictions_df = target_method(sample_input_data)
@@ -166,16 +199,34 @@ class SKLModelHandler(_base.BaseModelHandler[Union["sklearn.base.BaseEstimator",
 
         model_blob_path = os.path.join(model_blobs_dir_path, name)
         os.makedirs(model_blob_path, exist_ok=True)
-        with open(os.path.join(model_blob_path, cls.MODEL_BLOB_FILE_OR_DIR), "wb") as f:
-            cloudpickle.dump(model, f)
+        if model_file_type == cls._JOBLIB_FILE_TYPE:
+            import joblib
+
+            # Uncompressed so that the arrays can be memory-mapped when loading.
+            joblib.dump(
+                model,
+                os.path.join(model_blob_path, cls.MODEL_BLOB_FILE_OR_DIR),
+                compress=0,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        else:
+            with open(os.path.join(model_blob_path, cls.MODEL_BLOB_FILE_OR_DIR), "wb") as f:
+                cloudpickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Only record a non-default file type, so that pickled blobs keep the metadata older versions wrote.
+        model_blob_options = model_meta_schema.SKLModelBlobOptions()
+        if model_file_type == cls._JOBLIB_FILE_TYPE:
+            model_blob_options["model_file_type"] = model_file_type
         base_meta = model_blob_meta.ModelBlobMeta(
             name=name,
             model_type=cls.HANDLER_TYPE,
             handler_version=cls.HANDLER_VERSION,
             path=cls.MODEL_BLOB_FILE_OR_DIR,
+            options=model_blob_options,
         )
         model_meta.models[name] = base_meta
         model_meta.min_snowpark_ml_version = cls._MIN_SNOWPARK_ML_VERSION
+        if model_file_type == cls._JOBLIB_FILE_TYPE:
+            model_meta.min_snowpark_ml_version = cls._MIN_SNOWPARK_ML_VERSION_JOBLIB
 
         if enable_explainability:
             model_meta.env.include_if_absent([model_env.ModelDependency(requirement="shap", pip_name="shap")])
@@ -185,6 +236,12 @@ class SKLModelHandler(_base.BaseModelHandler[Union["sklearn.base.BaseEstimator",
             [model_env.ModelDependency(requirement="scikit-learn", pip_name="scikit-learn")],
             check_local_version=True,
         )
+        if model_file_type == cls._JOBLIB_FILE_TYPE:
+            # Pin joblib to the local version, as its array wrapper format is not guaranteed to load across versions.
+            model_meta.env.include_if_absent(
+                [model_env.ModelDependency(requirement="joblib", pip_name="joblib")],
+                check_local_version=True,
+            )
 
     @classmethod
     def load_model(
@@ -198,8 +255,14 @@ class SKLModelHandler(_base.BaseModelHandler[Union["sklearn.base.BaseEstimator",
         model_blobs_metadata = model_meta.models
         model_blob_metadata = model_blobs_metadata[name]
         model_blob_filename = model_blob_metadata.path
-        with open(os.path.join(model_blob_path, model_blob_filename), "rb") as f:
-            m = cloudpickle.load(f)
+        model_blob_options = cast(model_meta_schema.SKLModelBlobOptions, model_blob_metadata.options)
+        if model_blob_options.get("model_file_type", cls._PICKLE_FILE_TYPE) == cls._JOBLIB_FILE_TYPE:
+            import joblib
+
+            m = joblib.load(os.path.join(model_blob_path, model_blob_filename), mmap_mode="r")
+        else:
+            with open(os.path.join(model_blob_path, model_blob_filename), "rb") as f:
+                m = cloudpickle.load(f)
 
         import sklearn.base
         import sklearn.pipeline
@@ -227,16 +290,21 @@ class SKLModelHandler(_base.BaseModelHandler[Union["sklearn.base.BaseEstimator",
                 target_method: str,
                 background_data: Optional[pd.DataFrame],
             ) -> Callable[[custom_model.CustomModel, pd.DataFrame], pd.DataFrame]:
+                # Resolve the bound method once rather than per call; Pipeline resolves it through its final step.
+                # "explain" is not a model method and is served by explain_fn below.
+                model_method = getattr(raw_model, target_method, None)
+
                 @custom_model.inference_api
                 def fn(self: custom_model.CustomModel, X: pd.DataFrame) -> pd.DataFrame:
-                    res = getattr(raw_model, target_method)(X)
+                    res = model_method(X)
 
                     if isinstance(res, list) and len(res) > 0 and isinstance(res[0], np.ndarray):
                         # In case of multi-output estimators, predict_proba(), decision_function(), etc., functions
                         # return a list of ndarrays. We need to deal them separately
                         df = numpy_handler.SeqOfNumpyArrayHandler.convert_to_df(res)
                     else:
-                        df = pd.DataFrame(res)
+                        # res is freshly produced by the model, so let pandas adopt its buffer instead of copying.
+                        df = pd.DataFrame(res, copy=False)
 
                     return model_signature_utils.rename_pandas_df(df, signature.outputs)
 
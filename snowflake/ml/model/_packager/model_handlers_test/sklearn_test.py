@@ -3,11 +3,20 @@ import tempfile
 import warnings
 from unittest import mock
 
+import joblib
 import numpy as np
 import pandas as pd
 import shap
 from absl.testing import absltest
-from sklearn import datasets, ensemble, linear_model, multioutput
+from sklearn import (
+    datasets,
+    decomposition,
+    ensemble,
+    linear_model,
+    multioutput,
+    pipeline,
+    preprocessing,
+)
 
 from snowflake.ml.model import model_signature, type_hints as model_types
 from snowflake.ml.model._packager import model_packager
@@ -82,6 +91,7 @@ class SKLearnHandlerTest(absltest.TestCase):
             assert pk.model
             assert pk.meta
             assert isinstance(pk.model, multioutput.MultiOutputClassifier)
+            self.assertEqual(pk.meta.models["model1_no_sig"].options, {})
             np.testing.assert_allclose(
                 np.hstack(model.predict_proba(iris_X_df[-10:])), np.hstack(pk.model.predict_proba(iris_X_df[-10:]))
             )
@@ -105,6 +115,116 @@ class SKLearnHandlerTest(absltest.TestCase):
             assert callable(predict_method)
             np.testing.assert_allclose(model.predict(iris_X_df[-10:]), predict_method(iris_X_df[-10:]).to_numpy())
 
+    def test_skl_joblib_model_file_type(self) -> None:
+        iris_X, iris_y = datasets.load_iris(return_X_y=True)
+        model = ensemble.RandomForestClassifier(random_state=42)
+        iris_X_df = pd.DataFrame(iris_X, columns=["c1", "c2", "c3", "c4"])
+        model.fit(iris_X_df[:-10], iris_y[:-10])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            s = {"predict": model_signature.infer_signature(iris_X_df, model.predict(iris_X_df))}
+            with self.assertRaisesRegex(ValueError, "Unsupported model file type"):
+                model_packager.ModelPackager(os.path.join(tmpdir, "model1_bad")).save(
+                    name="model1_bad",
+                    model=model,
+                    signatures=s,
+                    metadata={"author": "halu", "version": "1"},
+                    options={"model_file_type": "onnx"},  # type: ignore[typeddict-item]
+                )
+
+            model_packager.ModelPackager(os.path.join(tmpdir, "model1")).save(
+                name="model1",
+                model=model,
+                signatures=s,
+                metadata={"author": "halu", "version": "1"},
+                options=model_types.SKLModelSaveOptions({"model_file_type": "joblib"}),
+            )
+
+            pk = model_packager.ModelPackager(os.path.join(tmpdir, "model1"))
+            pk.load()
+            assert pk.model
+            assert pk.meta
+            assert isinstance(pk.model, ensemble.RandomForestClassifier)
+            self.assertEqual(pk.meta.models["model1"].options, {"model_file_type": "joblib"})
+            self.assertIn(f"joblib=={joblib.__version__}", pk.meta.env.conda_dependencies)
+            np.testing.assert_allclose(model.predict(iris_X_df[-10:]), pk.model.predict(iris_X_df[-10:]))
+
+            pk = model_packager.ModelPackager(os.path.join(tmpdir, "model1"))
+            pk.load(as_custom_model=True)
+            assert pk.model
+            assert pk.meta
+            predict_method = getattr(pk.model, "predict", None)
+            assert callable(predict_method)
+            np.testing.assert_allclose(model.predict(iris_X_df[-10:]), predict_method(iris_X_df[-10:]).to_numpy()[:, 0])
+
+    def test_skl_pipeline_signature_transforms_once(self) -> None:
+        iris_X, iris_y = datasets.load_iris(return_X_y=True)
+        iris_X_df = pd.DataFrame(iris_X, columns=["c1", "c2", "c3", "c4"])
+        model = pipeline.Pipeline(
+            [("scaler", preprocessing.StandardScaler()), ("classifier", linear_model.LogisticRegression())]
+        )
+        model.fit(iris_X_df[:-10], iris_y[:-10])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(
+                preprocessing.StandardScaler,
+                "transform",
+                autospec=True,
+                side_effect=preprocessing.StandardScaler.transform,
+            ) as mock_transform:
+                model_packager.ModelPackager(os.path.join(tmpdir, "model1")).save(
+                    name="model1",
+                    model=model,
+                    sample_input_data=iris_X_df,
+                    metadata={"author": "halu", "version": "1"},
+                    options=model_types.SKLModelSaveOptions({"enable_explainability": False}),
+                )
+                mock_transform.assert_called_once()
+
+            pk = model_packager.ModelPackager(os.path.join(tmpdir, "model1"))
+            pk.load(as_custom_model=True)
+            assert pk.model
+            assert pk.meta
+            self.assertEqual(
+                set(pk.meta.signatures.keys()),
+                {"predict", "predict_proba", "predict_log_proba", "decision_function"},
+            )
+            for target_method in pk.meta.signatures.keys():
+                predict_method = getattr(pk.model, target_method, None)
+                assert callable(predict_method)
+                np.testing.assert_allclose(
+                    getattr(model, target_method)(iris_X_df[-10:]).reshape(10, -1),
+                    predict_method(iris_X_df[-10:]).to_numpy(),
+                )
+
+    def test_skl_pipeline_inverse_transform_signature(self) -> None:
+        iris_X, _ = datasets.load_iris(return_X_y=True)
+        iris_X_df = pd.DataFrame(iris_X, columns=["c1", "c2", "c3", "c4"])
+        model = pipeline.Pipeline([("scaler", preprocessing.StandardScaler()), ("pca", decomposition.PCA(2))])
+        model.fit(iris_X_df)
+        # inverse_transform runs every step's inverse_transform in reverse order, so it takes the reduced features.
+        reduced_X_df = pd.DataFrame(model.transform(iris_X_df), columns=["p1", "p2"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            model_packager.ModelPackager(os.path.join(tmpdir, "model1")).save(
+                name="model1",
+                model=model,
+                sample_input_data=reduced_X_df,
+                metadata={"author": "halu", "version": "1"},
+                options=model_types.SKLModelSaveOptions(
+                    {"target_methods": ["inverse_transform"], "enable_explainability": False}
+                ),
+            )
+
+            pk = model_packager.ModelPackager(os.path.join(tmpdir, "model1"))
+            pk.load(as_custom_model=True)
+            assert pk.model
+            assert pk.meta
+            self.assertLen(pk.meta.signatures["inverse_transform"].inputs, 2)
+            self.assertLen(pk.meta.signatures["inverse_transform"].outputs, 4)
+            predict_method = getattr(pk.model, "inverse_transform", None)
+            assert callable(predict_method)
+            np.testing.assert_allclose(
+                model.inverse_transform(reduced_X_df[-10:]), predict_method(reduced_X_df[-10:]).to_numpy()
+            )
+
     def test_skl_unsupported_explain(self) -> None:
         iris_X, iris_y = datasets.load_iris(return_X_y=True)
         target2 = np.random.randint(0, 6, size=iris_y.shape)
@@ -54,6 +54,10 @@ class MLFlowModelBlobOptions(BaseModelBlobOptions):
     artifact_path: Required[str]
 
 
+class SKLModelBlobOptions(BaseModelBlobOptions):
+    model_file_type: NotRequired[str]
+
+
 class XgboostModelBlobOptions(BaseModelBlobOptions):
     xgb_estimator_type: Required[str]
 
@@ -62,6 +66,7 @@ ModelBlobOptions = Union[
     BaseModelBlobOptions,
     HuggingFacePipelineModelBlobOptions,
     MLFlowModelBlobOptions,
+    SKLModelBlobOptions,
     XgboostModelBlobOptions,
 ]
 
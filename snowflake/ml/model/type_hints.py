@@ -154,7 +154,16 @@ class CustomModelSaveOption(BaseModelSaveOption):
 
 
 class SKLModelSaveOptions(BaseModelSaveOption):
+    """Options for saving the scikit-learn model.
+
+    model_file_type: Serialization format of the model blob. "joblib" stores the estimator uncompressed so that plain
+        numpy array attributes, such as `coef_`, are memory-mapped read-only on load instead of being copied into
+        memory. Tree based estimators still copy their node arrays when loaded. It uses plain pickling, so the
+        estimator and its components must be importable where the model is loaded. Defaults to "pickle".
+    """
+
     target_methods: NotRequired[Sequence[str]]
+    model_file_type: NotRequired[Literal["pickle", "joblib"]]
 
 
 class XGBModelSaveOptions(BaseModelSaveOption):
@@ -13,18 +13,38 @@ from tests.integ.snowflake.ml.test_utils import dataframe_utils
 
 
 class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBase):
+    cal_data: pd.DataFrame
+    cal_X_test: pd.DataFrame
+    regressor: xgboost.XGBRegressor
+    booster: xgboost.Booster
+    booster_predictions: np.ndarray
+    regressor_explanations: np.ndarray
+    booster_explanations: np.ndarray
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Models trained on local data do not depend on the per-test session, so fit them once for all test cases.
+        super().setUpClass()
+        cls.cal_data = datasets.load_breast_cancer(as_frame=True).frame
+        cls.cal_data.columns = [inflection.parameterize(c, "_") for c in cls.cal_data]
+        cal_X = cls.cal_data.drop(columns=["target"])
+        cal_y = cls.cal_data["target"]
+        cal_X_train, cls.cal_X_test, cal_y_train, _ = model_selection.train_test_split(cal_X, cal_y)
+        cls.regressor = xgboost.XGBRegressor(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3)
+        cls.regressor.fit(cal_X_train, cal_y_train)
+        params = dict(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3, objective="binary:logistic")
+        cls.booster = xgboost.train(params, xgboost.DMatrix(data=cal_X_train, label=cal_y_train))
+        cls.booster_predictions = cls.booster.predict(xgboost.DMatrix(data=cls.cal_X_test))
+        cls.regressor_explanations = shap.TreeExplainer(cls.regressor)(cls.cal_X_test).values
+        cls.booster_explanations = shap.TreeExplainer(cls.booster)(cls.cal_X_test).values
+
     @parameterized.product(
         registry_test_fn=registry_model_test_base.RegistryModelTestBase.REGISTRY_TEST_FN_LIST,
     )
     def test_xgb_manual_shap_override(self, registry_test_fn: str) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True)
-        cal_X = cal_data.data
-        cal_y = cal_data.target
-        cal_X.columns = [inflection.parameterize(c, "_") for c in cal_X.columns]
-        cal_X_train, cal_X_test, cal_y_train, cal_y_test = model_selection.train_test_split(cal_X, cal_y)
-        regressor = xgboost.XGBRegressor(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3)
-        regressor.fit(cal_X_train, cal_y_train)
-        expected_explanations = shap.TreeExplainer(regressor)(cal_X_test).values
+        regressor = self.regressor
+        cal_X_test = self.cal_X_test
+        expected_explanations = self.regressor_explanations
         getattr(self, registry_test_fn)(
             model=regressor,
             sample_input_data=cal_X_test,
@@ -46,13 +66,8 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True)
-        cal_X = cal_data.data
-        cal_y = cal_data.target
-        cal_X.columns = [inflection.parameterize(c, "_") for c in cal_X.columns]
-        cal_X_train, cal_X_test, cal_y_train, cal_y_test = model_selection.train_test_split(cal_X, cal_y)
-        regressor = xgboost.XGBRegressor(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3)
-        regressor.fit(cal_X_train, cal_y_train)
+        regressor = self.regressor
+        cal_X_test = self.cal_X_test
         getattr(self, registry_test_fn)(
             model=regressor,
             sample_input_data=cal_X_test,
@@ -74,14 +89,9 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True)
-        cal_X = cal_data.data
-        cal_y = cal_data.target
-        cal_X.columns = [inflection.parameterize(c, "_") for c in cal_X.columns]
-        cal_X_train, cal_X_test, cal_y_train, cal_y_test = model_selection.train_test_split(cal_X, cal_y)
-        regressor = xgboost.XGBRegressor(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3)
-        regressor.fit(cal_X_train, cal_y_train)
-        expected_explanations = shap.TreeExplainer(regressor)(cal_X_test).values
+        regressor = self.regressor
+        cal_X_test = self.cal_X_test
+        expected_explanations = self.regressor_explanations
         getattr(self, registry_test_fn)(
             model=regressor,
             sample_input_data=cal_X_test,
@@ -101,14 +111,9 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True)
-        cal_X = cal_data.data
-        cal_y = cal_data.target
-        cal_X.columns = [inflection.parameterize(c, "_") for c in cal_X.columns]
-        cal_X_train, cal_X_test, cal_y_train, cal_y_test = model_selection.train_test_split(cal_X, cal_y)
-        regressor = xgboost.XGBRegressor(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3)
-        regressor.fit(cal_X_train, cal_y_train)
-        expected_explanations = shap.TreeExplainer(regressor)(cal_X_test).values
+        regressor = self.regressor
+        cal_X_test = self.cal_X_test
+        expected_explanations = self.regressor_explanations
         getattr(self, registry_test_fn)(
             model=regressor,
             sample_input_data=cal_X_test,
@@ -129,22 +134,15 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True).frame
-        cal_data.columns = [inflection.parameterize(c, "_") for c in cal_data]
-        cal_data_sp_df = self.session.create_dataframe(cal_data)
+        cal_data_sp_df = self.session.create_dataframe(self.cal_data)
         cal_data_sp_df_train, cal_data_sp_df_test = tuple(cal_data_sp_df.random_split([0.25, 0.75], seed=2568))
         regressor = xgboost.XGBRegressor(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3)
         cal_data_pd_df_train = cal_data_sp_df_train.to_pandas()
         regressor.fit(cal_data_pd_df_train.drop(columns=["target"]), cal_data_pd_df_train["target"])
         cal_data_sp_df_test_X = cal_data_sp_df_test.drop('"target"')
+        cal_data_pd_df_test_X = cal_data_sp_df_test_X.to_pandas()
 
-        y_df_expected = pd.concat(
-            [
-                cal_data_sp_df_test_X.to_pandas(),
-                pd.DataFrame(regressor.predict(cal_data_sp_df_test_X.to_pandas()), columns=["output_feature_0"]),
-            ],
-            axis=1,
-        )
+        y_df_expected = cal_data_pd_df_test_X.assign(output_feature_0=regressor.predict(cal_data_pd_df_test_X))
         getattr(self, registry_test_fn)(
             model=regressor,
             sample_input_data=cal_data_sp_df_train.drop('"target"'),
@@ -164,21 +162,20 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True).frame
-        cal_data.columns = [inflection.parameterize(c, "_") for c in cal_data]
-        cal_data_sp_df = self.session.create_dataframe(cal_data)
+        cal_data_sp_df = self.session.create_dataframe(self.cal_data)
         cal_data_sp_df_train, cal_data_sp_df_test = tuple(cal_data_sp_df.random_split([0.25, 0.75], seed=2568))
         regressor = xgboost.XGBRegressor(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3)
         cal_data_pd_df_train = cal_data_sp_df_train.to_pandas()
         regressor.fit(cal_data_pd_df_train.drop(columns=["target"]), cal_data_pd_df_train["target"])
         cal_data_sp_df_test_X = cal_data_sp_df_test.drop('"target"')
+        cal_data_pd_df_test_X = cal_data_sp_df_test_X.to_pandas()
 
         explanation_df_expected = pd.concat(
             [
-                cal_data_sp_df_test_X.to_pandas(),
+                cal_data_pd_df_test_X,
                 pd.DataFrame(
-                    shap.TreeExplainer(regressor)(cal_data_sp_df_test_X.to_pandas()).values,
-                    columns=[f"{c}_explanation" for c in cal_data_sp_df_test_X.to_pandas().columns],
+                    shap.TreeExplainer(regressor)(cal_data_pd_df_test_X).values,
+                    columns=[f"{c}_explanation" for c in cal_data_pd_df_test_X.columns],
                 ),
             ],
             axis=1,
@@ -204,14 +201,9 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True)
-        cal_X = cal_data.data
-        cal_y = cal_data.target
-        cal_X.columns = [inflection.parameterize(c, "_") for c in cal_X.columns]
-        cal_X_train, cal_X_test, cal_y_train, cal_y_test = model_selection.train_test_split(cal_X, cal_y)
-        params = dict(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3, objective="binary:logistic")
-        regressor = xgboost.train(params, xgboost.DMatrix(data=cal_X_train, label=cal_y_train))
-        y_pred = regressor.predict(xgboost.DMatrix(data=cal_X_test))
+        regressor = self.booster
+        cal_X_test = self.cal_X_test
+        y_pred = self.booster_predictions
         getattr(self, registry_test_fn)(
             model=regressor,
             sample_input_data=cal_X_test,
@@ -231,14 +223,9 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True)
-        cal_X = cal_data.data
-        cal_y = cal_data.target
-        cal_X.columns = [inflection.parameterize(c, "_") for c in cal_X.columns]
-        cal_X_train, cal_X_test, cal_y_train, cal_y_test = model_selection.train_test_split(cal_X, cal_y)
-        params = dict(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3, objective="binary:logistic")
-        regressor = xgboost.train(params, xgboost.DMatrix(data=cal_X_train, label=cal_y_train))
-        expected_explanations = shap.TreeExplainer(regressor)(cal_X_test).values
+        regressor = self.booster
+        cal_X_test = self.cal_X_test
+        expected_explanations = self.booster_explanations
         getattr(self, registry_test_fn)(
             model=regressor,
             sample_input_data=cal_X_test,
@@ -258,9 +245,7 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True).frame
-        cal_data.columns = [inflection.parameterize(c, "_") for c in cal_data]
-        cal_data_sp_df = self.session.create_dataframe(cal_data)
+        cal_data_sp_df = self.session.create_dataframe(self.cal_data)
         cal_data_sp_df_train, cal_data_sp_df_test = tuple(cal_data_sp_df.random_split([0.25, 0.75], seed=2568))
         cal_data_pd_df_train = cal_data_sp_df_train.to_pandas()
         params = dict(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3, objective="binary:logistic")
@@ -269,15 +254,9 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
             xgboost.DMatrix(data=cal_data_pd_df_train.drop(columns=["target"]), label=cal_data_pd_df_train["target"]),
         )
         cal_data_sp_df_test_X = cal_data_sp_df_test.drop('"target"')
-        y_df_expected = pd.concat(
-            [
-                cal_data_sp_df_test_X.to_pandas(),
-                pd.DataFrame(
-                    regressor.predict(xgboost.DMatrix(data=cal_data_sp_df_test_X.to_pandas())),
-                    columns=["output_feature_0"],
-                ),
-            ],
-            axis=1,
+        cal_data_pd_df_test_X = cal_data_sp_df_test_X.to_pandas()
+        y_df_expected = cal_data_pd_df_test_X.assign(
+            output_feature_0=regressor.predict(xgboost.DMatrix(data=cal_data_pd_df_test_X))
         )
         getattr(self, registry_test_fn)(
             model=regressor,
@@ -298,9 +277,7 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True).frame
-        cal_data.columns = [inflection.parameterize(c, "_") for c in cal_data]
-        cal_data_sp_df = self.session.create_dataframe(cal_data)
+        cal_data_sp_df = self.session.create_dataframe(self.cal_data)
         cal_data_sp_df_train, cal_data_sp_df_test = tuple(cal_data_sp_df.random_split([0.25, 0.75], seed=2568))
         cal_data_pd_df_train = cal_data_sp_df_train.to_pandas()
         params = dict(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3, objective="binary:logistic")
@@ -309,12 +286,13 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
             xgboost.DMatrix(data=cal_data_pd_df_train.drop(columns=["target"]), label=cal_data_pd_df_train["target"]),
         )
         cal_data_sp_df_test_X = cal_data_sp_df_test.drop('"target"')
+        cal_data_pd_df_test_X = cal_data_sp_df_test_X.to_pandas()
         explanations_df_expected = pd.concat(
             [
-                cal_data_sp_df_test_X.to_pandas(),
+                cal_data_pd_df_test_X,
                 pd.DataFrame(
-                    shap.TreeExplainer(regressor)(cal_data_sp_df_test_X.to_pandas()).values,
-                    columns=[f"{c}_explanation" for c in cal_data_sp_df_test_X.to_pandas().columns],
+                    shap.TreeExplainer(regressor)(cal_data_pd_df_test_X).values,
+                    columns=[f"{c}_explanation" for c in cal_data_pd_df_test_X.columns],
                 ),
             ],
             axis=1,
@@ -341,18 +319,10 @@ class TestRegistryXGBoostModelInteg(registry_model_test_base.RegistryModelTestBa
         self,
         registry_test_fn: str,
     ) -> None:
-        cal_data = datasets.load_breast_cancer(as_frame=True)
-        cal_X = cal_data.data
-        cal_y = cal_data.target
-        cal_X.columns = [inflection.parameterize(c, "_") for c in cal_X.columns]
-        cal_X_train, cal_X_test, cal_y_train, cal_y_test = model_selection.train_test_split(cal_X, cal_y)
-        params = dict(n_estimators=100, reg_lambda=1, gamma=0, max_depth=3, objective="binary:logistic")
-        regressor = xgboost.train(params, xgboost.DMatrix(data=cal_X_train, label=cal_y_train))
-        y_pred = pd.DataFrame(
-            regressor.predict(xgboost.DMatrix(data=cal_X_test)),
-            columns=["output_feature_0"],
-        )
-        expected_explanations = shap.TreeExplainer(regressor)(cal_X_test).values
+        regressor = self.booster
+        cal_X_test = self.cal_X_test
+        y_pred = pd.DataFrame(self.booster_predictions, columns=["output_feature_0"])
+        expected_explanations = self.booster_explanations
         sig = {"predict": model_signature.infer_signature(cal_X_test, y_pred)}
         getattr(self, registry_test_fn)(
             model=regressor,